@@ -1,5 +1,6 @@
 import datetime
 import pytz  # For timezone handling
+from PerformanceMetrics import instrument
 
 class Appointment:
     def __init__(self, patient_name, appointment_type, start_time, duration):
@@ -35,6 +36,7 @@ class Scheduler:
         except ValueError:
             print("Invalid date format. Please use YYYY-MM-DD.")
 
+    @instrument(is_error=lambda result: result != "Appointment scheduled successfully.")
     def schedule_appointment(self, patient_name, appointment_type, date_str, time_str, duration):
         try:
             appointment_datetime_str = f"{date_str} {time_str}"
@@ -78,18 +80,19 @@ class Scheduler:
         return appointments_str
 
 # Example Usage
-scheduler = Scheduler(timezone="America/New_York") # Example Timezone
-scheduler.add_holiday("2024-12-25") # Example Holiday
+if __name__ == "__main__":
+    scheduler = Scheduler(timezone="America/New_York") # Example Timezone
+    scheduler.add_holiday("2024-12-25") # Example Holiday
 
-print(scheduler.schedule_appointment("Alice", "Checkup", "2024-12-24", "10:00", 30))
-print(scheduler.schedule_appointment("Bob", "Consultation", "2024-12-24", "10:15", 45))  # Overlap
-print(scheduler.schedule_appointment("Charlie", "X-ray", "2024-12-25", "11:00", 60)) # Holiday
-print(scheduler.schedule_appointment("David", "Physio", "2024-12-24", "14:00", 60))
-print(scheduler.schedule_appointment("Eve", "Therapy", "2024-12-24", "08:00", 60)) # Outside Business Hours
-print(scheduler.list_appointments())
+    print(scheduler.schedule_appointment("Alice", "Checkup", "2024-12-24", "10:00", 30))
+    print(scheduler.schedule_appointment("Bob", "Consultation", "2024-12-24", "10:15", 45))  # Overlap
+    print(scheduler.schedule_appointment("Charlie", "X-ray", "2024-12-25", "11:00", 60)) # Holiday
+    print(scheduler.schedule_appointment("David", "Physio", "2024-12-24", "14:00", 60))
+    print(scheduler.schedule_appointment("Eve", "Therapy", "2024-12-24", "08:00", 60)) # Outside Business Hours
+    print(scheduler.list_appointments())
 
-print(scheduler.cancel_appointment("Alice", datetime.datetime(2024, 12, 24, 10, 0, tzinfo=pytz.timezone("America/New_York"))))
-print(scheduler.list_appointments())
+    print(scheduler.cancel_appointment("Alice", datetime.datetime(2024, 12, 24, 10, 0, tzinfo=pytz.timezone("America/New_York"))))
+    print(scheduler.list_appointments())
 
-print(scheduler.schedule_appointment("Frank", "Checkup", "2024-12-24", "10:00", 30))
-print(scheduler.list_appointments())
+    print(scheduler.schedule_appointment("Frank", "Checkup", "2024-12-24", "10:00", 30))
+    print(scheduler.list_appointments())
@@ -0,0 +1,240 @@
+import os
+import sys
+import json
+import time
+import argparse
+import datetime
+import platform
+import tempfile
+import subprocess
+import contextlib
+from PerformanceMetrics import metrics
+
+BENCHMARKS = {}  # Subsystem name -> benchmark function(scale, workdir)
+
+def benchmark(name):
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+@benchmark("log_parser")
+def bench_log_parser(scale, workdir):
+    from LogFileParser import analyze_logs
+    log_file = os.path.join(workdir, f"bench_{scale}.log")
+    messages = [
+        "[ERROR] Database connection failed: timeout",
+        "[WARNING] High memory usage: 91%",
+        "[ERROR] Connection timeout to server B",
+        "[INFO] Request served",
+    ]
+    start = datetime.datetime(2024, 1, 15, 0, 0, 0)
+    with open(log_file, "w") as f:
+        for i in range(scale):
+            timestamp = start + datetime.timedelta(seconds=i)
+            f.write(f"{timestamp:%Y-%m-%d %H:%M:%S} {messages[i % len(messages)]}\n")
+    return lambda: analyze_logs(log_file)
+
+@benchmark("template_engine")
+def bench_template_engine(scale, workdir):
+    from StringTemplateEngine import TemplateEngine
+    engine = TemplateEngine()
+    context = {f"var{i}": i for i in range(scale)}
+    template = " ".join(f"{{var{i}}}" for i in range(scale))
+    return lambda: engine.render(template, context)
+
+@benchmark("data_validator")
+def bench_data_validator(scale, workdir):
+    from DataValidationSystem import DataValidator
+    schema_file = os.path.join(workdir, "bench_schema.json")
+    with open(schema_file, "w") as f:
+        json.dump({
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "email": {"type": "string", "format": "email"},
+                "age": {"type": "integer", "minimum": 0, "maximum": 120},
+            },
+            "required": ["name", "email"],
+        }, f)
+    validator = DataValidator(schema_file)
+    # Every record is valid so the benchmark times the full rule set, not early failures
+    records = [{"name": f"User {i}", "email": f"user{i}@example.com", "age": i % 121} for i in range(scale)]
+
+    def run():
+        for record in records:
+            validator.validate_data(record)
+    return run
+
+@benchmark("scheduler")
+def bench_scheduler(scale, workdir):
+    from AppointmentSchedulingSystem import Scheduler
+    slots = [(day, f"{hour:02d}:{minute:02d}") for day in range(1, 366)
+             for hour in range(9, 17) for minute in (0, 30)]
+    base_date = datetime.date(2025, 1, 1)
+
+    def run():
+        scheduler = Scheduler()  # Fresh scheduler per run so every booking succeeds
+        for i in range(scale):
+            day, time_str = slots[i % len(slots)]
+            date_str = str(base_date + datetime.timedelta(days=day - 1))
+            scheduler.schedule_appointment(f"Patient {i}", "Checkup", date_str, time_str, 30)
+    return run
+
+@benchmark("config_manager")
+def bench_config_manager(scale, workdir):
+    from JSONConfigurationManager import ConfigManager
+    manager = ConfigManager(
+        config_file=os.path.join(workdir, "bench_config.json"),
+        schema_file=os.path.join(workdir, "bench_config_schema.json"),
+        backup_dir=os.path.join(workdir, "bench_config_backups"),
+    )
+
+    def run():
+        for i in range(scale):
+            manager.set(f"section{i % 10}.key{i}", i)
+    return run
+
+@benchmark("calculator")
+def bench_calculator(scale, workdir):
+    from MathModuleCalculator import Calculator
+    calculator = Calculator()
+    # Valid expressions only; unit conversions are left out because they currently always fail
+    expressions = ["sin30", "cos60", "log100", "sqrt16", "mean1,2,3,4", "median5,1,3", "ln10", "2*(3+4)/7"]
+
+    def run():
+        calculator.clear_history()
+        for i in range(scale):
+            calculator.calculate(expressions[i % len(expressions)])
+    return run
+
+@benchmark("package_inventory")
+def bench_package_inventory(scale, workdir):
+    from PackageInstallationManager import PackageManager
+    manager = PackageManager(inventory_cache_file=os.path.join(workdir, "bench_inventory.json"))
+    requirements_file = os.path.join(workdir, f"bench_requirements_{scale}.txt")
+    with open(requirements_file, "w") as f:
+        for i in range(scale):
+            f.write(f"package-{i}=={i}.0\n")
+
+    def run():
+        manager.get_inventory(refresh=True)
+        manager.diff_requirements(requirements_file)
+    return run
+
+def time_benchmark(run, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def run_suite(names, scales, repeat, workdir):
+    results = {}
+    for name in names:
+        results[name] = {}
+        for scale in scales:
+            try:
+                # Silence the tools' own progress output while timing them
+                with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                    run = BENCHMARKS[name](scale, workdir)
+                    timings = time_benchmark(run, repeat)
+            except ImportError as e:
+                print(f"Skipping {name}: {e}")
+                del results[name]
+                break
+            except Exception as e:
+                # Report the broken subsystem and keep benchmarking the others
+                print(f"{name:<20} scale={scale:<8} FAILED: {type(e).__name__}: {e}")
+                results[name][str(scale)] = {"error": f"{type(e).__name__}: {e}"}
+                continue
+            best = min(timings)
+            results[name][str(scale)] = {
+                "best_seconds": best,
+                "mean_seconds": sum(timings) / len(timings),
+                "per_item_microseconds": best / scale * 1e6,
+            }
+            print(f"{name:<20} scale={scale:<8} best={best:.6f}s  per item={best / scale * 1e6:.2f}us")
+    return results
+
+def default_label():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+
+def load_history(history_file):
+    try:
+        with open(history_file, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON format in benchmark history file: {e}")
+
+def compare_runs(previous, current, threshold):
+    """Prints per-benchmark changes against a previous run and returns the regressions."""
+    regressions = []
+    print(f"\nComparison with '{previous['label']}':")
+    for name, scales in current["results"].items():
+        for scale, result in scales.items():
+            old = previous["results"].get(name, {}).get(scale)
+            if not old or "error" in old or "error" in result:
+                continue  # Nothing to compare against a failed run
+            change = (result["best_seconds"] - old["best_seconds"]) / old["best_seconds"]
+            marker = "  REGRESSION" if change > threshold else ""
+            print(f"- {name} scale={scale}: {old['best_seconds']:.6f}s -> {result['best_seconds']:.6f}s ({change:+.1%}){marker}")
+            if change > threshold:
+                regressions.append((name, scale, change))
+    return regressions
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every tool in this repository with synthetic data.")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run (default: all)")
+    parser.add_argument("--scales", nargs="+", type=positive_int, default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=positive_int, default=3)
+    parser.add_argument("--label", default=None, help="Name of this run (default: git commit)")
+    parser.add_argument("--history", default="benchmark_history.json", help="File that accumulates results across versions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative slowdown reported as a regression")
+    parser.add_argument("--metrics-json", help="Also collect per-call metrics and write them as JSON")
+    parser.add_argument("--metrics-prometheus", help="Also collect per-call metrics and write them in Prometheus text format")
+    args = parser.parse_args(argv)
+
+    if args.metrics_json or args.metrics_prometheus:
+        metrics.enable()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = run_suite(args.only or list(BENCHMARKS), args.scales, args.repeat, workdir)
+
+    current = {
+        "label": args.label or default_label(),
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "results": results,
+    }
+    history = load_history(args.history)
+    regressions = compare_runs(history[-1], current, args.threshold) if history else []
+    history.append(current)
+    with open(args.history, "w") as f:
+        json.dump(history, f, indent=4)
+    print(f"\nResults recorded in {args.history} as '{current['label']}'.")
+
+    if args.metrics_json:
+        metrics.export_json(args.metrics_json)
+    if args.metrics_prometheus:
+        metrics.export_prometheus(args.metrics_prometheus)
+    failures = [name for name, scales in results.items() if any("error" in result for result in scales.values())]
+    if failures:
+        print(f"Failed benchmarks: {', '.join(failures)}")
+    return 1 if regressions or failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@ import re
 import json
 import phonenumbers  # type: ignore # For international phone number validation
 from jsonschema import validate, ValidationError # type: ignore # For schema validation
+from PerformanceMetrics import instrument
 
 class DataValidator:
     def __init__(self, schema_file="validation_schema.json"):
@@ -18,6 +19,7 @@ class DataValidator:
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON format in schema file: {e}")
 
+    @instrument(is_error=lambda is_valid: not is_valid)  # Count records that failed validation
     def validate_data(self, data):
         self.validation_errors = []  # Clear previous errors
         try:
@@ -87,43 +89,44 @@ class DataValidator:
         return cleaned_data
 
 # Example Usage
-schema = {
-    "type": "object",
-    "properties": {
-        "name": {"type": "string", "required": True, "minLength": 3},
-        "email": {"type": "string", "format": "email", "required": True},
-        "phone": {"type": "string", "format": "phone"},
-        "age": {"type": "integer", "minimum": 0, "maximum": 120},
-        "address": {"type": "string", "format": "address"},
-        "custom_value": {"type": "integer", "custom": "value % 2 == 0"} # Custom validation rule
-    },
-    "required": ["name", "email"]
-}
-with open("validation_schema.json", "w") as f:
-    json.dump(schema, f, indent=4)
+if __name__ == "__main__":
+    schema = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "required": True, "minLength": 3},
+            "email": {"type": "string", "format": "email", "required": True},
+            "phone": {"type": "string", "format": "phone"},
+            "age": {"type": "integer", "minimum": 0, "maximum": 120},
+            "address": {"type": "string", "format": "address"},
+            "custom_value": {"type": "integer", "custom": "value % 2 == 0"} # Custom validation rule
+        },
+        "required": ["name", "email"]
+    }
+    with open("validation_schema.json", "w") as f:
+        json.dump(schema, f, indent=4)
 
-validator = DataValidator()
+    validator = DataValidator()
 
-valid_data = {"name": "John Doe", "email": "john.doe@example.com", "phone": "+15551234567", "age": 30, "address": "123 Main St", "custom_value": 4}
-invalid_data = {"name": "JD", "email": "invalid_email", "age": 150, "custom_value": 3}
-missing_data = {"name": "Jane", "phone": "+447911123456", "age": 25, "address": "Some other address"}
+    valid_data = {"name": "John Doe", "email": "john.doe@example.com", "phone": "+15551234567", "age": 30, "address": "123 Main St", "custom_value": 4}
+    invalid_data = {"name": "JD", "email": "invalid_email", "age": 150, "custom_value": 3}
+    missing_data = {"name": "Jane", "phone": "+447911123456", "age": 25, "address": "Some other address"}
 
-print("Valid Data:")
-if validator.validate_data(valid_data):
-    print("Data is valid")
-else:
-    print(validator.get_validation_report())
-cleaned_valid_data = validator.clean_data(valid_data)
-print("Cleaned data:", cleaned_valid_data)
+    print("Valid Data:")
+    if validator.validate_data(valid_data):
+        print("Data is valid")
+    else:
+        print(validator.get_validation_report())
+    cleaned_valid_data = validator.clean_data(valid_data)
+    print("Cleaned data:", cleaned_valid_data)
 
-print("\nInvalid Data:")
-if validator.validate_data(invalid_data):
-    print("Data is valid")
-else:
-    print(validator.get_validation_report())
+    print("\nInvalid Data:")
+    if validator.validate_data(invalid_data):
+        print("Data is valid")
+    else:
+        print(validator.get_validation_report())
 
-print("\nMissing Data:")
-if validator.validate_data(missing_data):
-    print("Data is valid")
-else:
-    print(validator.get_validation_report())
+    print("\nMissing Data:")
+    if validator.validate_data(missing_data):
+        print("Data is valid")
+    else:
+        print(validator.get_validation_report())
@@ -3,6 +3,7 @@ import os
 import shutil
 import datetime
 import jsonschema  # type: ignore # For schema validation
+from PerformanceMetrics import instrument
 
 class ConfigManager:
     def __init__(self, config_file="config.json", schema_file="config_schema.json", backup_dir="config_backups"):
@@ -68,6 +69,7 @@ class ConfigManager:
         except AttributeError:  # Handle cases where value is not a dict
             return default
 
+    @instrument()
     def set(self, path, value):
         """Sets a config value using a dot-separated path."""
         if self.schema:
@@ -109,44 +111,45 @@ class ConfigManager:
             raise ValueError(f"Invalid JSON format in environment config file: {e}")
 
 # Example Usage:
-config_manager = ConfigManager()
-
-# Example schema
-schema = {
-    "type": "object",
-    "properties": {
-        "database": {
-            "type": "object",
-            "properties": {
-                "host": {"type": "string"},
-                "port": {"type": "integer"}
+if __name__ == "__main__":
+    config_manager = ConfigManager()
+
+    # Example schema
+    schema = {
+        "type": "object",
+        "properties": {
+            "database": {
+                "type": "object",
+                "properties": {
+                    "host": {"type": "string"},
+                    "port": {"type": "integer"}
+                },
+                "required": ["host", "port"]
             },
-            "required": ["host", "port"]
+            "api_key": {"type": "string"}
         },
-        "api_key": {"type": "string"}
-    },
-    "required": ["database"]
-}
-with open("config_schema.json", "w") as f:
-    json.dump(schema, f, indent=4)
-
-config_manager.set("database.host", "localhost")
-config_manager.set("database.port", 5432)
-config_manager.set("api_key", "your_api_key")
-
-print("Database Host:", config_manager.get("database.host"))
-print("Non-existent setting:", config_manager.get("non.existent", "default_value"))
-
-# Example environment config
-env_config = {"database": {"port": 5433}, "new_env_setting": "test"}
-with open("config_dev.json", "w") as f:
-    json.dump(env_config, f, indent=4)
-
-config_manager.merge_config("dev")
-print("Database Port after merge:", config_manager.get("database.port"))
-print("New environment setting:", config_manager.get("new_env_setting"))
-
-try:
-    config_manager.set("database.port", "invalid") # Invalid value according to the schema
-except ValueError as e:
-    print(e)
+        "required": ["database"]
+    }
+    with open("config_schema.json", "w") as f:
+        json.dump(schema, f, indent=4)
+
+    config_manager.set("database.host", "localhost")
+    config_manager.set("database.port", 5432)
+    config_manager.set("api_key", "your_api_key")
+
+    print("Database Host:", config_manager.get("database.host"))
+    print("Non-existent setting:", config_manager.get("non.existent", "default_value"))
+
+    # Example environment config
+    env_config = {"database": {"port": 5433}, "new_env_setting": "test"}
+    with open("config_dev.json", "w") as f:
+        json.dump(env_config, f, indent=4)
+
+    config_manager.merge_config("dev")
+    print("Database Port after merge:", config_manager.get("database.port"))
+    print("New environment setting:", config_manager.get("new_env_setting"))
+
+    try:
+        config_manager.set("database.port", "invalid") # Invalid value according to the schema
+    except ValueError as e:
+        print(e)
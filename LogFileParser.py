@@ -1,7 +1,9 @@
 import re
 from collections import Counter
 from datetime import datetime
+from PerformanceMetrics import instrument
 
+@instrument(is_error=lambda result: result == "Log file not found.")
 def analyze_logs(log_file, start_time=None, end_time=None):
     """Analyzes log files, extracts errors, and generates summaries."""
 
@@ -57,9 +59,10 @@ def generate_report(errors, error_counts):
     return report
 
 # Example usage:
-log_file = "server.log"  # Create a dummy log file for testing
-with open(log_file, 'w') as f:
-    f.write("""2024-01-15 14:30:25 [ERROR] Database connection failed: timeout
+if __name__ == "__main__":
+    log_file = "server.log"  # Create a dummy log file for testing
+    with open(log_file, 'w') as f:
+        f.write("""2024-01-15 14:30:25 [ERROR] Database connection failed: timeout
 2024-01-15 14:30:28 [WARNING] High memory usage: 85%
 2024-01-15 14:30:30 [ERROR] Connection timeout to server A
 2024-01-15 14:30:35 [INFO] Server started
@@ -67,17 +70,17 @@ with open(log_file, 'w') as f:
 invalid line
 2024-01-16 10:00:00 [ERROR] Another timeout error""")
 
-start_time = datetime(2024, 1, 15, 14, 30, 0)
-end_time = datetime(2024, 1, 15, 14, 31, 0)
+    start_time = datetime(2024, 1, 15, 14, 30, 0)
+    end_time = datetime(2024, 1, 15, 14, 31, 0)
 
-errors, error_counts = analyze_logs(log_file, start_time, end_time)
-report = generate_report(errors, error_counts)
-print(report)
+    errors, error_counts = analyze_logs(log_file, start_time, end_time)
+    report = generate_report(errors, error_counts)
+    print(report)
 
-errors_all, error_counts_all = analyze_logs(log_file)
-report_all = generate_report(errors_all, error_counts_all)
-print("\nFull Log Report:\n", report_all)
+    errors_all, error_counts_all = analyze_logs(log_file)
+    report_all = generate_report(errors_all, error_counts_all)
+    print("\nFull Log Report:\n", report_all)
 
-#Example of file not found handling
-result = analyze_logs("nonexistent_file.log")
-print("\nFile not found handling:\n", result)
+    #Example of file not found handling
+    result = analyze_logs("nonexistent_file.log")
+    print("\nFile not found handling:\n", result)
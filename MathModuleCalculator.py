@@ -1,5 +1,6 @@
 import math
 import statistics
+from PerformanceMetrics import instrument
 
 class Calculator:
     def __init__(self):
@@ -19,6 +20,7 @@ class Calculator:
             for item in self.history:
                 print(item)
 
+    @instrument(is_error=lambda result: isinstance(result, str) and result.startswith("Invalid input:"))
     def calculate(self, expression):
         try:
             expression = expression.lower().replace(" ", "")  # Normalize input
@@ -67,24 +69,26 @@ class Calculator:
         except (ValueError, SyntaxError, NameError, TypeError, ZeroDivisionError) as e:
             return f"Invalid input: {e}"
 
-calculator = Calculator()
+# Example Usage
+if __name__ == "__main__":
+    calculator = Calculator()
 
-while True:
-    print("\nScientific Calculator")
-    print("Available operations: sin, cos, tan, log, ln, sqrt, mean(num1,num2,...), median(num1,num2,...), unit conversions(e.g 25ctof), basic arithmetic (+, -, *, /)")
-    print("Enter 'history' to view calculation history, 'clear' to clear history, or 'exit' to quit.")
+    while True:
+        print("\nScientific Calculator")
+        print("Available operations: sin, cos, tan, log, ln, sqrt, mean(num1,num2,...), median(num1,num2,...), unit conversions(e.g 25ctof), basic arithmetic (+, -, *, /)")
+        print("Enter 'history' to view calculation history, 'clear' to clear history, or 'exit' to quit.")
 
-    expression = input("Enter your calculation: ")
+        expression = input("Enter your calculation: ")
 
-    if expression.lower() == "exit":
-        break
-    elif expression.lower() == "history":
-        calculator.display_history()
-        continue
-    elif expression.lower() == "clear":
-      calculator.clear_history()
-      print("History cleared.")
-      continue
+        if expression.lower() == "exit":
+            break
+        elif expression.lower() == "history":
+            calculator.display_history()
+            continue
+        elif expression.lower() == "clear":
+          calculator.clear_history()
+          print("History cleared.")
+          continue
 
-    result = calculator.calculate(expression)
-    print("Result:", result)
+        result = calculator.calculate(expression)
+        print("Result:", result)
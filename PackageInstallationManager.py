@@ -1,11 +1,37 @@
 import subprocess
 import os
+import errno
+import re
 import sys
+import glob
+import json
+import site
+import sysconfig
+import shutil
+import threading
+import time
 import venv
+import importlib.metadata
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PerformanceMetrics import instrument
+try:
+    from packaging.requirements import Requirement, InvalidRequirement  # type: ignore
+    from packaging.specifiers import SpecifierSet  # type: ignore
+    from packaging.version import Version, InvalidVersion  # type: ignore
+except ImportError:  # packaging is optional; without it only plain == pins are compared
+    Requirement = None
 
 class PackageManager:
-    def __init__(self):
+    def __init__(self, inventory_cache_file="package_inventory.json"):
         self.installed_packages = {}  # Track installed packages and versions
+        self.inventory_cache_file = inventory_cache_file
+        self._inventory_cache = None  # On-disk cache contents, loaded lazily
+        self.environment_pool = []  # Pre-warmed environments ready to hand out
+        self.pool_template = None  # Set by warm_environment_pool
+        self.pool_size = 0
+        self.pool_dir = "env_pool"
+        self._pool_lock = threading.Lock()
+        self._refill_lock = threading.Lock()  # Serializes pool refills
 
     def create_virtual_environment(self, env_name):
         try:
@@ -19,6 +45,186 @@ class PackageManager:
         except Exception as e:
             print(f"Error creating virtual environment: {e}")
 
+    def create_environment_template(self, template_name, packages=(), wheelhouse=None):
+        """Builds a base environment once so it can be cloned cheaply later."""
+        try:
+            venv.create(template_name, with_pip=True)
+        except Exception as e:
+            print(f"Error creating environment template: {e}")
+            return False
+        if packages and not self.install_many(packages, environments=[template_name], wheelhouse=wheelhouse)[template_name]:
+            return False
+        print(f"Environment template '{template_name}' is ready.")
+        return True
+
+    def _link_or_copy(self, src, dst):
+        try:
+            os.link(src, dst)  # Share the file with the template instead of copying it
+        except OSError:
+            shutil.copy2(src, dst)  # Cross-device or unsupported filesystem
+
+    def _relocate_environment(self, env_name, old_root, new_root):
+        """Rewrites absolute paths left in activation scripts, script shebangs and pyvenv.cfg."""
+        old_path, new_path = old_root.encode(), new_root.encode()
+        scripts_dir = os.path.join(env_name, "Scripts" if sys.platform == "win32" else "bin")
+        candidates = [os.path.join(env_name, "pyvenv.cfg")]
+        if os.path.isdir(scripts_dir):
+            candidates += [os.path.join(scripts_dir, name) for name in os.listdir(scripts_dir)]
+        for path in candidates:
+            if os.path.islink(path) or not os.path.isfile(path):
+                continue
+            with open(path, "rb") as f:
+                content = f.read()
+            if old_path not in content:
+                continue
+            mode = os.stat(path).st_mode
+            os.unlink(path)  # Break the hardlink so the template keeps its own copy
+            with open(path, "wb") as f:
+                f.write(content.replace(old_path, new_path))
+            os.chmod(path, mode)
+
+    def clone_environment(self, template_name, env_name):
+        """Creates env_name from a template, hardlinking files where the filesystem allows.
+
+        Files under site-packages stay shared with the template, so packages
+        should be upgraded with pip (which replaces files) rather than edited in
+        place. Windows .exe launchers embed the template path and are not rewritten.
+        """
+        if os.path.exists(env_name):
+            print(f"Cannot clone into '{env_name}': path already exists.")
+            return False
+        try:
+            shutil.copytree(template_name, env_name, symlinks=True, copy_function=self._link_or_copy)
+            self._relocate_environment(env_name, os.path.abspath(template_name), os.path.abspath(env_name))
+        except (OSError, shutil.Error) as e:
+            print(f"Error cloning environment '{template_name}': {e}")
+            shutil.rmtree(env_name, ignore_errors=True)
+            return False
+        print(f"Virtual environment '{env_name}' cloned from '{template_name}'.")
+        return True
+
+    def _pool_marker(self, env_name):
+        return os.path.join(env_name, ".pool_template")  # Records which template a pooled clone came from
+
+    def _belongs_to_pool(self, path):
+        """Checks that a pooled clone lives in pool_dir and was cloned from pool_template."""
+        if os.path.dirname(os.path.abspath(path)) != os.path.abspath(self.pool_dir):
+            return False
+        try:
+            with open(self._pool_marker(path), "r") as f:
+                return f.read().strip() == os.path.abspath(self.pool_template)
+        except OSError:
+            return False
+
+    def _adopt_pooled_environments(self, stale_after=3600):
+        """Adds finished clones left in pool_dir by earlier runs and removes stale partial clones."""
+        for entry in sorted(os.listdir(self.pool_dir)):
+            path = os.path.join(self.pool_dir, entry)
+            if entry.startswith(".partial_"):
+                # The name carries its creation time; copytree copies the template's mtime
+                started_ns = entry.split("_")[1]
+                if started_ns.isdigit() and time.time() - int(started_ns) / 1e9 > stale_after:
+                    shutil.rmtree(path, ignore_errors=True)  # Clone interrupted in an earlier run
+                continue
+            if not entry.startswith("env_") or not self._belongs_to_pool(path):
+                continue  # Not a finished clone of the current template
+            with self._pool_lock:
+                if path not in self.environment_pool:
+                    self.environment_pool.append(path)
+
+    def _refill_pool(self):
+        with self._refill_lock:
+            while True:
+                with self._pool_lock:
+                    if len(self.environment_pool) >= self.pool_size:
+                        break
+                suffix = f"{time.time_ns()}_{os.getpid()}"
+                partial_env = os.path.join(self.pool_dir, f".partial_{suffix}")
+                pooled_env = os.path.join(self.pool_dir, f"env_{suffix}")
+                if not self.clone_environment(self.pool_template, partial_env):
+                    break
+                try:
+                    with open(self._pool_marker(partial_env), "w") as f:
+                        f.write(os.path.abspath(self.pool_template))
+                    # Only complete clones ever appear under their final name
+                    os.rename(partial_env, pooled_env)
+                    self._relocate_environment(pooled_env, os.path.abspath(partial_env), os.path.abspath(pooled_env))
+                except OSError as e:
+                    print(f"Error adding environment to the pool: {e}")
+                    shutil.rmtree(partial_env, ignore_errors=True)
+                    shutil.rmtree(pooled_env, ignore_errors=True)
+                    break
+                with self._pool_lock:
+                    self.environment_pool.append(pooled_env)
+
+    def _start_pool_refill(self):
+        threading.Thread(target=self._refill_pool, daemon=True).start()
+
+    def warm_environment_pool(self, template_name, size=3, pool_dir="env_pool", wait=False):
+        """Prepares a pool of clones of template_name holding at least size environments.
+
+        Finished clones left in pool_dir by earlier runs are reused immediately.
+        Missing ones are cloned in the background unless wait is True.
+        """
+        self.pool_template, self.pool_size, self.pool_dir = template_name, size, pool_dir
+        os.makedirs(pool_dir, exist_ok=True)
+        with self._pool_lock:
+            # Clones of a previous template or pool_dir stay on disk for a later warm-up to adopt
+            self.environment_pool = [path for path in self.environment_pool if self._belongs_to_pool(path)]
+        self._adopt_pooled_environments()
+        if wait:
+            self._refill_pool()
+        else:
+            self._start_pool_refill()
+
+    def acquire_environment(self, env_name):
+        """Hands out a pre-warmed environment as env_name and refills the pool in the background."""
+        if self.pool_template is None:
+            print("Environment pool is not initialized. Call warm_environment_pool first.")
+            return False
+        if os.path.exists(env_name):
+            print(f"Cannot acquire environment '{env_name}': path already exists.")
+            return False
+        try:
+            # A missing parent would make every rename below fail like a vanished clone
+            os.makedirs(os.path.dirname(os.path.abspath(env_name)), exist_ok=True)
+        except OSError as e:
+            print(f"Cannot acquire environment '{env_name}': {e}")
+            return False
+        while True:
+            with self._pool_lock:
+                pooled_env = self.environment_pool.pop() if self.environment_pool else None
+            if pooled_env is None:
+                acquired = self.clone_environment(self.pool_template, env_name)  # Pool exhausted
+                break
+            try:
+                os.rename(pooled_env, env_name)
+            except OSError as e:
+                if isinstance(e, FileNotFoundError) and not os.path.exists(pooled_env):
+                    continue  # Taken by another process sharing the pool directory
+                with self._pool_lock:
+                    self.environment_pool.append(pooled_env)  # The pooled clone is still intact
+                if e.errno == errno.EXDEV:
+                    # The pool lives on another filesystem, so clone directly instead
+                    acquired = self.clone_environment(self.pool_template, env_name)
+                else:
+                    print(f"Error acquiring pooled environment: {e}")
+                    acquired = False
+                break
+            try:
+                os.remove(self._pool_marker(env_name))
+                self._relocate_environment(env_name, os.path.abspath(pooled_env), os.path.abspath(env_name))
+            except OSError as e:
+                print(f"Error relocating pooled environment: {e}")
+                shutil.rmtree(env_name, ignore_errors=True)
+                acquired = False
+                break
+            print(f"Virtual environment '{env_name}' taken from the pool.")
+            acquired = True
+            break
+        self._start_pool_refill()
+        return acquired
+
     def install_package(self, package_name, version=None):
         install_command = [sys.executable, "-m", "pip", "install"]
         if version:
@@ -35,6 +241,96 @@ class PackageManager:
         except Exception as e:
             print(f"An unexpected error occurred: {e}")
 
+    def get_environment_python(self, env_name):
+        if env_name is None:
+            return sys.executable  # The interpreter running this manager
+        if sys.platform == "win32":
+            return os.path.join(env_name, "Scripts", "python.exe")
+        return os.path.join(env_name, "bin", "python")
+
+    def build_install_command(self, python_executable, requirements, wheelhouse=None):
+        """Builds a single pip command that resolves and installs all requirements together."""
+        install_command = [python_executable, "-m", "pip", "install", "--disable-pip-version-check"]
+        if wheelhouse:
+            # Offline install: never touch the index, only the local wheel cache
+            install_command += ["--no-index", "--find-links", wheelhouse]
+        for requirement, _, _ in requirements:
+            install_command.append(requirement)
+        return install_command
+
+    def normalize_requirements(self, requirements):
+        """Returns (pip requirement, package name, pinned version or None) for each item."""
+        normalized = []
+        for requirement in requirements:
+            if isinstance(requirement, (tuple, list)):
+                package_name, version = requirement
+                requirement = f"{package_name}=={version}" if version else package_name
+            else:
+                requirement = requirement.strip()
+                match = re.match(r"([A-Za-z0-9][A-Za-z0-9._-]*)\s*(\[[^\]]*\])?\s*(.*)", requirement)
+                if not match:
+                    print(f"Skipping unrecognized requirement: {requirement}")
+                    continue
+                package_name, specifier = match.group(1), match.group(3).strip()
+                # Only an exact pin names a version; extras and ranges are left to pip
+                pin = re.fullmatch(r"==\s*([^\s,;*=]+)", specifier)
+                version = pin.group(1) if pin else None
+            normalized.append((requirement, package_name.strip(), version))
+        return normalized
+
+    def _run_batched_install(self, env_name, requirements, wheelhouse):
+        label = env_name or "current"
+        install_command = self.build_install_command(self.get_environment_python(env_name), requirements, wheelhouse)
+        # Stream pip output so per-package progress is visible while the batch runs
+        process = subprocess.Popen(install_command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        output = []
+        for line in process.stdout:
+            line = line.rstrip()
+            output.append(line)
+            if line.startswith(("Collecting", "Processing", "Installing collected packages", "Successfully installed", "ERROR")):
+                print(f"[{label}] {line}")
+        return process.wait(), output
+
+    @instrument(is_error=lambda results: not all(results.values()))
+    def install_many(self, requirements, environments=None, wheelhouse=None, max_workers=4):
+        """Installs a set of packages with one pip invocation per environment.
+
+        requirements may contain pip requirement strings such as "name",
+        "name==version" or "name[extra]>=version", or (name, version) items.
+        environments is a list of virtual environment directories (None means the
+        current interpreter); independent environments are installed concurrently
+        by a bounded worker pool. If wheelhouse is given, packages are installed
+        offline from that local directory of wheels.
+        """
+        requirements = self.normalize_requirements(requirements)
+        if not requirements:
+            print("No packages to install.")
+            return {}
+        environments = list(environments) if environments else [None]
+        results = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(environments)))) as executor:
+            futures = {executor.submit(self._run_batched_install, env_name, requirements, wheelhouse): env_name
+                       for env_name in environments}
+            for future in as_completed(futures):
+                env_name = futures[future]
+                label = env_name or "current"
+                try:
+                    returncode, output = future.result()
+                except OSError as e:
+                    print(f"Error installing packages into '{label}': {e}")
+                    results[env_name] = False
+                    continue
+                results[env_name] = returncode == 0
+                if returncode == 0:
+                    print(f"Installed {len(requirements)} package(s) into '{label}' successfully.")
+                    if env_name is None:
+                        for _, package_name, version in requirements:
+                            self.track_package(package_name, version)
+                else:
+                    print(f"Error installing packages into '{label}' (pip exited with {returncode}).")
+        return results
+
     def uninstall_package(self, package_name):
         uninstall_command = [sys.executable, "-m", "pip", "uninstall", "-y", package_name]
         try:
@@ -45,28 +341,166 @@ class PackageManager:
             print(f"Error uninstalling package '{package_name}': {e}")
 
     def track_package(self, package_name, version):
-        try:
-            import importlib
-            package = importlib.import_module(package_name)
-            if hasattr(package, '__version__'):
-                self.installed_packages[package_name] = package.__version__
-            elif version:
-                self.installed_packages[package_name] = version
-            else:
-                self.installed_packages[package_name] = "Version information not available"
-        except ImportError:
+        # Read the version from distribution metadata instead of importing the package
+        installed_version = self.get_inventory().get(self.normalize_name(package_name))
+        if installed_version:
+            self.installed_packages[package_name] = installed_version
+        else:
             print(f"Could not automatically determine version of {package_name}")
             if version:
                 self.installed_packages[package_name] = version
             else:
                 self.installed_packages[package_name] = "Version information not available"
 
+    def normalize_name(self, package_name):
+        return re.sub(r"[-_.]+", "-", package_name).lower()  # PEP 503 normalization
+
+    def get_site_directories(self, env_name=None):
+        """Returns the existing package directories of an environment, in import order."""
+        if env_name is None:
+            paths = sysconfig.get_paths()
+            candidates = [paths["purelib"], paths["platlib"]]  # platlib differs on e.g. Fedora/RHEL
+            if site.ENABLE_USER_SITE:
+                candidates.insert(0, site.getusersitepackages())  # User site shadows site-packages
+        elif sys.platform == "win32":
+            candidates = [os.path.join(env_name, "Lib", "site-packages")]
+        else:
+            candidates = sorted(glob.glob(os.path.join(env_name, "lib*", "python*", "site-packages")))
+        directories, seen = [], set()
+        for directory in candidates:
+            real_path = os.path.realpath(directory)
+            if real_path not in seen and os.path.isdir(real_path):
+                seen.add(real_path)
+                directories.append(real_path)
+        return directories
+
+    def _load_inventory_cache(self):
+        if self._inventory_cache is None:
+            try:
+                with open(self.inventory_cache_file, "r") as f:
+                    self._inventory_cache = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._inventory_cache = {}
+        return self._inventory_cache
+
+    def _save_inventory_cache(self):
+        try:
+            with open(self.inventory_cache_file, "w") as f:
+                json.dump(self._inventory_cache, f, indent=4)
+        except OSError as e:
+            print(f"Failed to save package inventory cache: {e}")
+
+    @instrument()
+    def get_inventory(self, env_name=None, refresh=False):
+        """Returns {normalized name: version} for every distribution in an environment.
+
+        Every package directory (user site, purelib and platlib) is scanned for
+        dist-info/egg-info metadata only. Each directory is cached on disk keyed by
+        its mtime, which changes whenever pip adds or removes a distribution.
+        """
+        site_directories = self.get_site_directories(env_name)
+        if not site_directories:
+            print(f"No site-packages directory found for '{env_name or 'current'}'.")
+            return {}
+
+        cache = self._load_inventory_cache()
+        inventory = {}
+        cache_changed = False
+        for site_packages in site_directories:
+            mtime = os.stat(site_packages).st_mtime_ns
+            entry = cache.get(site_packages)
+            if refresh or not entry or entry.get("mtime") != mtime:
+                packages = {}
+                for distribution in importlib.metadata.distributions(path=[site_packages]):
+                    name = distribution.metadata["Name"]
+                    if name:
+                        packages.setdefault(self.normalize_name(name), distribution.version)
+                entry = cache[site_packages] = {"mtime": mtime, "packages": packages}
+                cache_changed = True
+            for name, version in entry["packages"].items():
+                inventory.setdefault(name, version)  # Earlier directories shadow later ones
+        if cache_changed:
+            self._save_inventory_cache()
+        return inventory
+
+    def parse_requirements_file(self, requirements_file):
+        """Returns {normalized name: version specifier string or None}."""
+        requirements = {}
+        with open(requirements_file, "r") as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if not line or line.startswith("-"):
+                    continue  # Skip blank lines, comments and pip options
+                line = line.split(";", 1)[0].strip()  # Drop environment markers
+                if Requirement is not None:
+                    try:
+                        requirement = Requirement(line)
+                    except InvalidRequirement:
+                        print(f"Skipping unrecognized requirement: {line}")
+                        continue
+                    package_name, specifier = requirement.name, str(requirement.specifier)
+                else:
+                    match = re.match(r"([A-Za-z0-9][A-Za-z0-9._-]*)\s*(\[[^\]]*\])?\s*(.*)", line)
+                    if not match:
+                        print(f"Skipping unrecognized requirement: {line}")
+                        continue
+                    package_name, specifier = match.group(1), match.group(3).strip()
+                requirements[self.normalize_name(package_name)] = specifier or None
+        return requirements
+
+    def normalize_version(self, version):
+        # Fallback comparison without packaging: "1.0", "1.0.0" and "v1" are equal
+        version = version.strip().lower().lstrip("v")
+        while version.endswith(".0") and version.count(".") > 0:
+            version = version[:-2]
+        return version
+
+    def version_satisfies(self, installed_version, specifier):
+        """Returns False only when installed_version definitely violates specifier."""
+        if Requirement is not None:
+            try:
+                return SpecifierSet(specifier).contains(Version(installed_version), prereleases=True)
+            except InvalidVersion:
+                return True  # Legacy version string; cannot be compared reliably
+        pin = re.fullmatch(r"==\s*([^\s,;*=]+)", specifier)
+        if not pin:
+            return True  # Ranges and wildcards need packaging to evaluate
+        return self.normalize_version(installed_version) == self.normalize_version(pin.group(1))
+
+    def diff_requirements(self, requirements_file, env_name=None):
+        """Compares a requirements file with the installed inventory.
+
+        Version specifiers are evaluated with packaging when it is installed;
+        otherwise only plain "==" pins are checked and anything else is treated
+        as satisfied when the package is installed.
+        """
+        try:
+            requirements = self.parse_requirements_file(requirements_file)
+        except FileNotFoundError:
+            print(f"Requirements file not found: {requirements_file}")
+            return None
+        inventory = self.get_inventory(env_name)
+        diff = {"missing": [], "mismatched": {}, "extra": []}
+        for package_name, specifier in requirements.items():
+            installed_version = inventory.get(package_name)
+            if installed_version is None:
+                diff["missing"].append(package_name)
+            elif specifier and not self.version_satisfies(installed_version, specifier):
+                diff["mismatched"][package_name] = (specifier, installed_version)
+        diff["extra"] = sorted(set(inventory) - set(requirements))
+        return diff
+
     def untrack_package(self, package_name):
         if package_name in self.installed_packages:
             del self.installed_packages[package_name]
 
-    def list_installed_packages(self):
-        if self.installed_packages:
+    def list_installed_packages(self, all_packages=False, env_name=None):
+        if all_packages:
+            inventory = self.get_inventory(env_name)
+            print(f"Installed packages ({len(inventory)}):")
+            for package, version in sorted(inventory.items()):
+                print(f"- {package}: {version}")
+        elif self.installed_packages:
             print("Installed packages:")
             for package, version in self.installed_packages.items():
                 print(f"- {package}: {version}")
@@ -74,17 +508,30 @@ class PackageManager:
             print("No packages installed.")
 
 # Example Usage
-manager = PackageManager()
+if __name__ == "__main__":
+    manager = PackageManager()
+
+    manager.create_virtual_environment("my_env") # Create a Virtual Environment
+
+    # Activate the virtual environment before installing packages
+    # Windows: my_env\Scripts\activate
+    # Linux/macOS: source my_env/bin/activate
+
+    manager.install_package("requests")
+    manager.install_package("numpy", "1.23.0") # Install a specific version
+    manager.list_installed_packages()
+    manager.uninstall_package("numpy")
+    manager.list_installed_packages()
+    manager.install_package("nonexistent_package") # Example of handling installation failure
 
-manager.create_virtual_environment("my_env") # Create a Virtual Environment
+    manager.list_installed_packages(all_packages=True) # Every distribution, read from cached metadata
+    # manager.diff_requirements("requirements.txt") # Missing, mismatched and extra packages
 
-# Activate the virtual environment before installing packages
-# Windows: my_env\Scripts\activate
-# Linux/macOS: source my_env/bin/activate
+    # Build a template once, then clone it or hand out pre-warmed copies
+    # manager.create_environment_template("base_env", ["requests"])
+    # manager.clone_environment("base_env", "ci_env_1")
+    # manager.warm_environment_pool("base_env", size=3)
+    # manager.acquire_environment("ci_env_2")
 
-manager.install_package("requests")
-manager.install_package("numpy", "1.23.0") # Install a specific version
-manager.list_installed_packages()
-manager.uninstall_package("numpy")
-manager.list_installed_packages()
-manager.install_package("nonexistent_package") # Example of handling installation failure
+    # Install several packages in one pip run, offline from a local wheelhouse, into two environments
+    # manager.install_many(["requests", "numpy==1.23.0"], environments=["my_env", "other_env"], wheelhouse="wheelhouse")
@@ -0,0 +1,204 @@
+import os
+import io
+import json
+import time
+import bisect
+import pstats
+import cProfile
+import functools
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+# Latency bucket upper bounds in seconds (Prometheus-style, cumulative on export)
+DEFAULT_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # Last slot is the +Inf bucket
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q):
+        """Approximates a quantile as the upper bound of the bucket that contains it, capped at the observed max."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.buckets, self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"], self.counts)),
+        }
+
+class MetricsRegistry:
+    def __init__(self):
+        # Disabled by default; instrumented calls then cost a single attribute check
+        self.enabled = os.environ.get("PY_TOOLS_METRICS") == "1"
+        self._lock = threading.Lock()
+        self.reset()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self.calls = {}
+            self.errors = {}
+            self.latency = {}
+            self.profiles = {}
+            self.memory = {}
+
+    def record(self, name, elapsed, failed=False):
+        with self._lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+            if failed:
+                self.errors[name] = self.errors.get(name, 0) + 1
+            if name not in self.latency:
+                self.latency[name] = Histogram()
+            self.latency[name].observe(elapsed)
+
+    @contextmanager
+    def profile(self, name, sort_by="cumulative", limit=20):
+        """Runs the enclosed block under cProfile and keeps the top entries as text."""
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield profiler
+        finally:
+            profiler.disable()
+            output = io.StringIO()
+            pstats.Stats(profiler, stream=output).sort_stats(sort_by).print_stats(limit)
+            with self._lock:
+                self.profiles[name] = output.getvalue()
+
+    @contextmanager
+    def trace_memory(self, name, limit=10):
+        """Records peak traced memory and the top allocation sites of the enclosed block."""
+        already_tracing = tracemalloc.is_tracing()
+        if not already_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            top_stats = tracemalloc.take_snapshot().compare_to(before, "lineno")[:limit]
+            if not already_tracing:
+                tracemalloc.stop()
+            with self._lock:
+                self.memory[name] = {
+                    "current_bytes": current,
+                    "peak_bytes": peak,
+                    "top_allocations": [str(stat) for stat in top_stats],
+                }
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "calls": dict(self.calls),
+                "errors": dict(self.errors),
+                "latency_seconds": {name: histogram.to_dict() for name, histogram in self.latency.items()},
+                "profiles": dict(self.profiles),
+                "memory": dict(self.memory),
+            }
+
+    def export_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.snapshot(), f, indent=4)
+
+    def export_prometheus(self, path):
+        """Writes counters and latency histograms in the Prometheus text exposition format."""
+        lines = [
+            "# HELP tool_calls_total Number of instrumented calls.",
+            "# TYPE tool_calls_total counter",
+        ]
+        with self._lock:
+            for name, count in sorted(self.calls.items()):
+                lines.append(f'tool_calls_total{{function="{name}"}} {count}')
+            lines += [
+                "# HELP tool_errors_total Number of instrumented calls that raised or returned a failure.",
+                "# TYPE tool_errors_total counter",
+            ]
+            for name in sorted(self.calls):
+                lines.append(f'tool_errors_total{{function="{name}"}} {self.errors.get(name, 0)}')
+            lines += [
+                "# HELP tool_call_duration_seconds Latency of instrumented calls.",
+                "# TYPE tool_call_duration_seconds histogram",
+            ]
+            for name, histogram in sorted(self.latency.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(histogram.buckets, histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(f'tool_call_duration_seconds_bucket{{function="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'tool_call_duration_seconds_bucket{{function="{name}",le="+Inf"}} {histogram.count}')
+                lines.append(f'tool_call_duration_seconds_sum{{function="{name}"}} {histogram.total}')
+                lines.append(f'tool_call_duration_seconds_count{{function="{name}"}} {histogram.count}')
+        with open(path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+metrics = MetricsRegistry()  # Shared by every tool in this repository
+
+def instrument(name=None, is_error=None):
+    """Decorator that records call count, errors and latency while metrics are enabled.
+
+    A call counts as an error when it raises, or when is_error(result) is true for
+    tools that report failures through their return value instead of raising.
+    """
+    def decorator(func):
+        metric_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not metrics.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                metrics.record(metric_name, time.perf_counter() - start, failed=True)
+                raise
+            elapsed = time.perf_counter() - start
+            metrics.record(metric_name, elapsed, failed=is_error is not None and bool(is_error(result)))
+            return result
+        return wrapper
+    return decorator
+
+# Example Usage
+if __name__ == "__main__":
+    @instrument()
+    def slow_square(x):
+        time.sleep(0.001)
+        return x * x
+
+    metrics.enable()
+    with metrics.profile("slow_square"), metrics.trace_memory("slow_square"):
+        for i in range(50):
+            slow_square(i)
+    print(json.dumps(metrics.snapshot()["latency_seconds"], indent=4))
+    metrics.export_prometheus("metrics.prom")
@@ -1,16 +1,18 @@
 import re
+from PerformanceMetrics import instrument
 
 class TemplateEngine:
     def __init__(self, delimiters=("{", "}")):
         self.open_delim, self.close_delim = delimiters
         self.pattern = re.compile(re.escape(self.open_delim) + r"(.*?)" + re.escape(self.close_delim))
 
+    @instrument(is_error=lambda result: isinstance(result, TemplateErrorMessage))
     def render(self, template, context):
         """Renders the template with the given context."""
         try:
             return self._render_recursive(template, context)
         except TemplateError as e:
-            return str(e)  # Return error message instead of raising exception
+            return TemplateErrorMessage(e)  # Return error message instead of raising exception
 
     def _render_recursive(self, template, context):
         """Recursively renders nested templates."""
@@ -54,18 +56,23 @@ class TemplateError(Exception):
     """Custom exception for template errors."""
     pass
 
-# Example usage:
-template_engine = TemplateEngine()
-
-context = {
-    "name": "John Doe",
-    "age": 30,
-    "city": "New York",
-    "items": [{"name": "Laptop", "price": 1200}, {"name": "Mouse", "price": 25}],
-    "user": {"address": {"street": "123 Main St"}}
-}
+class TemplateErrorMessage(str):
+    """Error message returned by render(); behaves like a str but marks the failure."""
+    pass
 
-template = """
+# Example usage:
+if __name__ == "__main__":
+    template_engine = TemplateEngine()
+
+    context = {
+        "name": "John Doe",
+        "age": 30,
+        "city": "New York",
+        "items": [{"name": "Laptop", "price": 1200}, {"name": "Mouse", "price": 25}],
+        "user": {"address": {"street": "123 Main St"}}
+    }
+
+    template = """
 Hello {name}, you are {age} years old and live in {city}.
 
 Items:
@@ -84,27 +91,27 @@ You live in London
 {endif}
 """
 
-rendered_template = template_engine.render(template, context)
-print(rendered_template)
+    rendered_template = template_engine.render(template, context)
+    print(rendered_template)
 
-template_error_example = "Hello {nonexistent_variable}"
-rendered_error = template_engine.render(template_error_example, context)
-print("\nError example:", rendered_error)
+    template_error_example = "Hello {nonexistent_variable}"
+    rendered_error = template_engine.render(template_error_example, context)
+    print("\nError example:", rendered_error)
 
-template_invalid_expression = "Hello {1/0}"
-rendered_invalid = template_engine.render(template_invalid_expression, context)
-print("\nInvalid expression example:", rendered_invalid)
+    template_invalid_expression = "Hello {1/0}"
+    rendered_invalid = template_engine.render(template_invalid_expression, context)
+    print("\nInvalid expression example:", rendered_invalid)
 
-template_invalid_condition = "{if age > 'test'}"
-rendered_invalid_condition = template_engine.render(template_invalid_condition, context)
-print("\nInvalid condition example:", rendered_invalid_condition)
+    template_invalid_condition = "{if age > 'test'}"
+    rendered_invalid_condition = template_engine.render(template_invalid_condition, context)
+    print("\nInvalid condition example:", rendered_invalid_condition)
 
-template_nested = "Outer { {inner} } Outer"
-context_nested = {"inner": "Inner Value"}
-rendered_nested = template_engine.render(template_nested, context_nested)
-print("\nNested template example:", rendered_nested)
+    template_nested = "Outer { {inner} } Outer"
+    context_nested = {"inner": "Inner Value"}
+    rendered_nested = template_engine.render(template_nested, context_nested)
+    print("\nNested template example:", rendered_nested)
 
-template_with_format = "Price: {item['price']:.2f}"
-context_with_format = {"item": {"price": 12.345}}
-rendered_with_format = template_engine.render(template_with_format, context_with_format)
-print("\nTemplate with format example:", rendered_with_format)
+    template_with_format = "Price: {item['price']:.2f}"
+    context_with_format = {"item": {"price": 12.345}}
+    rendered_with_format = template_engine.render(template_with_format, context_with_format)
+    print("\nTemplate with format example:", rendered_with_format)